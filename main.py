@@ -1,12 +1,35 @@
 import csv
+import io
+import math
 import os
+import pickle
+import sys
+from array import array
 from datetime import datetime
+from functools import lru_cache
+
+# Column order of the expense CSV file
+FIELDNAMES = ('date', 'category', 'amount', 'description')
+
+@lru_cache(maxsize=1024)
+def _validate_date(date_text):
+    """Parse a YYYY-MM-DD date, caching results for dates that are entered repeatedly"""
+    return datetime.strptime(date_text, "%Y-%m-%d")
 
 class PersonalExpenseTracker:
     def __init__(self):
-        self.expenses = []
+        # Expenses are stored column-wise, aligned by index; amounts are packed C doubles
+        self.dates = []
+        self.categories = []
+        self.amounts = array('d')
+        self.descriptions = []
         self.monthly_budget = 0
         self.filename = "expenses.csv"
+        self.budget_filename = "expenses.budget"
+        self.cache_filename = "expenses.pkl"
+        self._total = None
+        self._csv_stale = False
+        self._matches_csv = False
         self.load_expenses()
 
     def add_expense(self):
@@ -18,7 +41,7 @@ class PersonalExpenseTracker:
             date_input = input("Enter the date (YYYY-MM-DD): ").strip()
             try:
                 # Validate date format
-                datetime.strptime(date_input, "%Y-%m-%d")
+                _validate_date(date_input)
                 break
             except ValueError:
                 print("Invalid date format. Please use YYYY-MM-DD format.")
@@ -44,40 +67,88 @@ class PersonalExpenseTracker:
         while not description:
             description = input("Description cannot be empty. Please enter a description: ").strip()
 
-        # Create expense dictionary
-        expense = {
-            'date': date_input,
-            'category': category,
-            'amount': amount,
-            'description': description
-        }
+        self._store_expense(date_input, category, amount, description)
 
-        # Add to expenses list
-        self.expenses.append(expense)
+    def quick_add_expense(self):
+        """Function to add a new expense entered on a single line"""
+        print("\n--- Quick Add Expense ---")
+
+        while True:
+            line = input("Enter date,category,amount,description: ")
+            try:
+                date_input, category, amount, description = (field.strip() for field in next(csv.reader([line])))
+                _validate_date(date_input)
+                amount = float(amount)
+            except ValueError:
+                print("Invalid entry. Please use the format YYYY-MM-DD,Category,Amount,Description.")
+                continue
+            if amount <= 0:
+                print("Amount must be greater than 0.")
+                continue
+            if not category or not description:
+                print("Category and description cannot be empty.")
+                continue
+            break
+
+        self._store_expense(date_input, category, amount, description)
+
+    def _store_expense(self, date, category, amount, description):
+        """Add a validated expense to the expense columns and the CSV file"""
+        # Categories repeat a lot, so every occurrence shares one interned string
+        category = sys.intern(category)
+        self.dates.append(date)
+        self.categories.append(category)
+        self.amounts.append(amount)
+        self.descriptions.append(description)
+
+        self._total = None
+        self._append_expense(date, category, amount, description)
         print(f"Expense added successfully! ${amount:.2f} for {category}")
 
+    def _expense_total(self):
+        """Return the exact total of all expenses, computed once and cached until the next change"""
+        if self._total is None:
+            self._total = math.fsum(self.amounts)
+        return self._total
+
+    def _append_expense(self, date, category, amount, description):
+        """Append a single expense row to the CSV file, writing the header if the file is new"""
+        try:
+            with open(self.filename, 'a+b') as raw:
+                new_file = raw.tell() == 0
+                if not new_file:
+                    # A hand-edited file may lack a final newline; add one so the row stays separate
+                    raw.seek(-1, os.SEEK_END)
+                    if raw.read(1) not in (b'\n', b'\r'):
+                        raw.write(b'\r\n')
+
+                with io.TextIOWrapper(raw, encoding='utf-8', newline='') as file:
+                    writer = csv.writer(file)
+                    if new_file:
+                        writer.writerow(FIELDNAMES)
+                    writer.writerow((date, category, amount, description))
+        except Exception as e:
+            # Fall back to rewriting the whole file on the next save
+            self._csv_stale = True
+            print(f"Error saving expense: {e}")
+
     def view_expenses(self):
         """Function to display all stored expenses"""
         print("\n--- Your Expenses ---")
 
-        if not self.expenses:
+        if not self.amounts:
             print("No expenses recorded yet.")
             return
 
-        print(f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description'}")
-        print("-" * 60)
-
-        total = 0
-        for expense in self.expenses:
-            # Validate that all required fields are present
-            if all(key in expense and expense[key] for key in ['date', 'category', 'amount', 'description']):
-                print(f"{expense['date']:<12} {expense['category']:<15} ${expense['amount']:<9.2f} {expense['description']}")
-                total += expense['amount']
-            else:
-                print("Incomplete expense entry found - skipping")
-
-        print("-" * 60)
-        print(f"Total expenses: ${total:.2f}")
+        # Build the whole listing in memory and emit it with a single write
+        row_format = "{:<12} {:<15} ${:<9.2f} {}".format
+        separator = "-" * 60
+        lines = [f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description'}", separator]
+        lines.extend(map(row_format, self.dates, self.categories, self.amounts, self.descriptions))
+        lines.append(separator)
+        lines.append(f"Total expenses: ${self._expense_total():.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def set_budget(self):
         """Function to set monthly budget"""
@@ -103,9 +174,7 @@ class PersonalExpenseTracker:
             self.set_budget()
             return
 
-        # Calculate total expenses
-        total_expenses = sum(expense['amount'] for expense in self.expenses
-                             if all(key in expense and expense[key] for key in ['date', 'category', 'amount', 'description']))
+        total_expenses = self._expense_total()
 
         print(f"Monthly Budget: ${self.monthly_budget:.2f}")
         print(f"Total Expenses: ${total_expenses:.2f}")
@@ -118,68 +187,151 @@ class PersonalExpenseTracker:
             print(f"You have ${remaining:.2f} left for the month")
 
     def save_expenses(self):
-        """Function to save expenses to CSV file"""
+        """Function to save the pickle cache and budget file, rewriting the CSV file only if an append failed"""
         try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as file:
-                if self.expenses:
-                    fieldnames = ['date', 'category', 'amount', 'description']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.expenses)
+            # New expenses are appended as they are added, so the CSV only needs
+            # a full rewrite if one of those appends failed. Never rewrite it from
+            # columns that failed to load, or the missing rows would be lost.
+            if self._csv_stale and self._matches_csv:
+                with open(self.filename, 'w', newline='', encoding='utf-8') as file:
+                    if self.amounts:
+                        writer = csv.writer(file)
+                        writer.writerow(FIELDNAMES)
+                        writer.writerows(zip(self.dates, self.categories, self.amounts, self.descriptions))
+                self._csv_stale = False
+
+            # Binary copy of the columns so the next start-up can skip CSV parsing, stamped
+            # with the CSV's signature; only written when the columns mirror the CSV
+            signature = self._csv_signature() if self._matches_csv else None
+            if signature:
+                with open(self.cache_filename, 'wb') as file:
+                    pickle.dump((signature, (self.dates, self.categories, self.amounts, self.descriptions)), file)
+            else:
+                try:
+                    os.remove(self.cache_filename)
+                except FileNotFoundError:
+                    pass
 
-                # Save budget info in a separate line (simple approach)
-                file.write(f"#BUDGET,{self.monthly_budget}\n")
+            # Budget lives in its own file so the CSV stays plain
+            with open(self.budget_filename, 'w', encoding='utf-8') as file:
+                file.write(f"{self.monthly_budget}\n")
 
             print(f"Expenses saved to {self.filename}")
         except Exception as e:
             print(f"Error saving expenses: {e}")
 
+    def load_budget(self):
+        """Function to load the monthly budget from its file"""
+        try:
+            with open(self.budget_filename, 'r', encoding='utf-8') as file:
+                self.monthly_budget = float(file.read().strip())
+        except (OSError, ValueError):
+            self.monthly_budget = 0
+
+    def _extend_columns(self, dates, categories, amounts, descriptions):
+        """Append whole columns of already validated and interned expenses to the store"""
+        # Columns arrive as sized sequences, so each list is resized exactly once
+        self.dates.extend(dates)
+        self.categories.extend(categories)
+        self.amounts.extend(amounts)
+        self.descriptions.extend(descriptions)
+        self._total = None
+
+    def _csv_signature(self):
+        """Return the CSV file's modification time and size, or None if it does not exist"""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_cache(self):
+        """Load expenses from the binary cache if the CSV file is unchanged since it was written"""
+        try:
+            # Note that unpickling runs whatever code the file contains, so the cache is only
+            # as trustworthy as the working directory it is read from.
+            with open(self.cache_filename, 'rb') as file:
+                signature, (dates, categories, amounts, descriptions) = pickle.load(file)
+            # Size as well as mtime, so an append within the same timestamp tick is still noticed
+            if signature is None or signature != self._csv_signature():
+                return False
+            amounts = array('d', amounts)
+            # Intern in place on a sized copy so cached categories share strings with new ones
+            categories = list(categories)
+            for index, category in enumerate(categories):
+                categories[index] = sys.intern(category)
+            if not len(dates) == len(categories) == len(amounts) == len(descriptions):
+                return False
+        except Exception:
+            # Any unreadable or malformed cache is a miss; the CSV is parsed instead
+            return False
+
+        self._extend_columns(dates, categories, amounts, descriptions)
+        return True
+
+    def _load_legacy_budget(self, row):
+        """Take the budget from a #BUDGET row written by older versions inside the CSV file"""
+        # Only used if expenses.budget gave us nothing; the next save rewrites the CSV
+        # with a proper header and without this row
+        if not self.monthly_budget:
+            try:
+                self.monthly_budget = float(row[1])
+            except (ValueError, IndexError):
+                self.monthly_budget = 0
+        self._csv_stale = True
+
+    def _load_csv(self):
+        """Parse expenses from the CSV file"""
+        with open(self.filename, 'r', newline='', encoding='utf-8') as file:
+            # Stream the file straight into the CSV reader; columns are read by position
+            csv_reader = csv.reader(file)
+            header = next(csv_reader, None)
+            if header and header[0] == "#BUDGET":
+                # A budget-only file from an older version has no header row at all
+                self._load_legacy_budget(header)
+
+            rows = []
+            for row in csv_reader:
+                # Blank lines carry no expense; DictReader used to skip them silently
+                if not row:
+                    continue
+
+                if row[0] == "#BUDGET":
+                    self._load_legacy_budget(row)
+                    continue
+
+                # Validate and convert amount to float; only complete rows are stored
+                try:
+                    date, category, amount, description = row
+                    amount = float(amount)
+                except ValueError:
+                    print(f"Skipping invalid expense entry: {row}")
+                    continue
+                if not (amount and date and category and description):
+                    print(f"Skipping invalid expense entry: {row}")
+                    continue
+                rows.append((date, sys.intern(category), amount, description))
+
+        # Transpose the valid rows into the expense columns in one bulk step
+        if rows:
+            self._extend_columns(*zip(*rows))
+
     def load_expenses(self):
-        """Function to load expenses from CSV file"""
-        if not os.path.exists(self.filename):
-            print(f"No existing expense file found. Starting fresh.")
-            return
+        """Function to load expenses, preferring the binary cache over re-parsing the CSV file"""
+        self.load_budget()
 
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                # Read all lines
-                lines = file.readlines()
-
-                # Check for budget line
-                budget_line = None
-                csv_lines = []
-
-                for line in lines:
-                    if line.startswith("#BUDGET,"):
-                        budget_line = line
-                    else:
-                        csv_lines.append(line)
-
-                # Load budget if found
-                if budget_line:
-                    try:
-                        self.monthly_budget = float(budget_line.split(',')[1].strip())
-                    except (ValueError, IndexError):
-                        self.monthly_budget = 0
-
-                # Process CSV data
-                if csv_lines:
-                    # Write CSV lines to a temporary string for csv.reader
-                    csv_content = ''.join(csv_lines)
-                    csv_reader = csv.DictReader(csv_content.splitlines())
-
-                    for row in csv_reader:
-                        # Validate and convert amount to float
-                        try:
-                            row['amount'] = float(row['amount'])
-                            self.expenses.append(row)
-                        except (ValueError, KeyError):
-                            print(f"Skipping invalid expense entry: {row}")
-
-            print(f"Loaded {len(self.expenses)} expenses from {self.filename}")
+            if not self._load_cache():
+                self._load_csv()
+            self._matches_csv = True
+
+            print(f"Loaded {len(self.amounts)} expenses from {self.filename}")
             if self.monthly_budget > 0:
                 print(f"Monthly budget: ${self.monthly_budget:.2f}")
 
+        except FileNotFoundError:
+            self._matches_csv = True
+            print(f"No existing expense file found. Starting fresh.")
         except Exception as e:
             print(f"Error loading expenses: {e}")
 
@@ -193,6 +345,7 @@ class PersonalExpenseTracker:
         print("3. Track budget")
         print("4. Save expenses")
         print("5. Exit")
+        print("6. Quick add expense (date,category,amount,description)")
         print("-"*50)
 
     def run(self):
@@ -202,7 +355,7 @@ class PersonalExpenseTracker:
         while True:
             self.display_menu()
 
-            choice = input("Please select an option (1-5): ").strip()
+            choice = input("Please select an option (1-6): ").strip()
 
             if choice == '1':
                 self.add_expense()
@@ -217,8 +370,10 @@ class PersonalExpenseTracker:
                 self.save_expenses()
                 print("Thank you for using Personal Expense Tracker!")
                 break
+            elif choice == '6':
+                self.quick_add_expense()
             else:
-                print("Invalid option. Please select a number between 1 and 5.")
+                print("Invalid option. Please select a number between 1 and 6.")
 
 # Run the expense tracker
 if __name__ == "__main__":